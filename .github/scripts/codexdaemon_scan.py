@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
+import io
 import os
+import sys
+import argparse
 from datetime import datetime
 from pathlib import Path
 
@@ -13,25 +16,42 @@ DANGEROUS_PATTERNS = [
     "eval(", "exec(", "open(", "import os", "openai.api_key",
     "# evolve", "# hallucinate", "@codex"
 ]
+SKIP_DIRS = {'.git', '.venv', '__pycache__', '.codex'}
 
 # === SCAN FUNCTION ===
+def scan_text(text):
+    hits = []
+    # Universal newlines, split on "\n" only — same lines as iterating an open file.
+    for lineno, line in enumerate(io.StringIO(text, newline=None), 1):
+        for pattern in DANGEROUS_PATTERNS:
+            if pattern in line:
+                hits.append((lineno, pattern.strip()))
+    return hits
+
 def perform_codex_scan():
     matches = []
     for root, dirs, files in os.walk(REPO_ROOT):
-        dirs[:] = [d for d in dirs if d not in {'.git', '.venv', '__pycache__', '.codex'}]
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
         for file in files:
             if file.endswith(".py"):
                 path = Path(root) / file
                 try:
                     with open(path, "r", encoding="utf-8") as f:
-                        for lineno, line in enumerate(f, 1):
-                            for pattern in DANGEROUS_PATTERNS:
-                                if pattern in line:
-                                    matches.append((str(path.relative_to(REPO_ROOT)), lineno, pattern.strip()))
+                        hits = scan_text(f.read())
                 except (UnicodeDecodeError, FileNotFoundError):
                     continue
+                rel_path = str(path.relative_to(REPO_ROOT))
+                matches.extend((rel_path, lineno, pattern) for lineno, pattern in hits)
     return matches
 
+def perform_codex_scan_rev(store, rev):
+    """Scan .py files of a commit straight from the git object database."""
+    return [
+        (path, lineno, pattern)
+        for path, hits in store.map_blobs(rev, scan_text, suffix=".py", exclude=SKIP_DIRS)
+        for lineno, pattern in hits
+    ]
+
 # === FORMAT HTML BLOCK ===
 def build_codex_scan_block(results, timestamp):
     if not results:
@@ -96,6 +116,29 @@ def update_readme_codex_block():
 
     print(f"✅ CodexDaemon scan complete: {len(results)} issues logged.")
 
+# === SCAN REVISIONS ===
+def scan_revisions(revs):
+    from git_objects import GitObjectStore
+
+    with GitObjectStore(REPO_ROOT) as store:
+        for rev in revs:
+            try:
+                results = perform_codex_scan_rev(store, rev)
+            except ValueError as e:
+                print(f"❌ {e}")
+                sys.exit(1)
+            print(f"[CodexDaemon] Scan @ {rev}")
+            for file, line, pattern in results:
+                print(f"{file}:{line} — {pattern}")
+            print(f"✅ {rev}: {len(results)} issues across {len(set(r[0] for r in results))} files.")
+
 # === EXECUTE ===
 if __name__ == "__main__":
-    update_readme_codex_block()
+    parser = argparse.ArgumentParser(description="CodexDaemon threat scan")
+    parser.add_argument("--rev", action="append", metavar="REV",
+                        help="Scan a commit from the git object database instead of the working tree (repeatable)")
+    args = parser.parse_args()
+    if args.rev:
+        scan_revisions(args.rev)
+    else:
+        update_readme_codex_block()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+CodexDaemon Git Object Reader
+-----------------------------
+Reads files straight from the git object database so scanners can inspect
+any commit (a past revision, a PR head) without a checkout.
+
+Trees are listed with `git ls-tree`; blob contents are streamed through a
+single persistent `git cat-file --batch` process. Per-blob results are
+memoized by SHA, so a file unchanged across revisions is only scanned once.
+"""
+
+import subprocess
+from pathlib import Path
+
+
+class GitObjectStore:
+    def __init__(self, repo_root):
+        self.repo_root = Path(repo_root)
+        self._proc = None
+        self._results = {}
+
+    # === Context Management ===
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._proc is not None:
+            self._proc.stdin.close()
+            self._proc.wait()
+            self._proc = None
+
+    def _git(self, *args):
+        return subprocess.run(
+            ["git", "-C", str(self.repo_root), *args],
+            check=True, capture_output=True,
+        ).stdout
+
+    # === Revisions + Trees ===
+    def resolve(self, rev):
+        """Return the full commit SHA for rev, or raise ValueError."""
+        try:
+            return self._git("rev-parse", "--verify", "--quiet", f"{rev}^{{commit}}").decode().strip()
+        except subprocess.CalledProcessError:
+            raise ValueError(f"Unknown revision: {rev}")
+
+    def ls_tree(self, rev, suffix=None, exclude=()):
+        """Return [(path, blob_sha)] for regular files in rev's tree."""
+        commit = self.resolve(rev)
+        entries = []
+        for record in self._git("ls-tree", "-r", "-z", "--full-tree", commit).split(b"\0"):
+            if not record:
+                continue
+            meta, path = record.split(b"\t", 1)
+            mode, kind, sha = meta.split()
+            if kind != b"blob" or mode == b"120000":
+                continue
+            path = path.decode("utf-8", errors="surrogateescape")
+            if suffix and not path.endswith(suffix):
+                continue
+            if any(part in exclude for part in path.split("/")[:-1]):
+                continue
+            entries.append((path, sha.decode()))
+        return entries
+
+    def rev_list(self, rev, since=None):
+        """Return [(commit_sha, unix_time)] along rev's first-parent chain, oldest first."""
+        spec = f"{since}..{rev}" if since else rev
+        out = self._git("log", "--first-parent", "--reverse", "--format=%H %ct", spec).decode()
+        return [(sha, int(ts)) for sha, ts in (line.split() for line in out.splitlines())]
+
+    def is_ancestor(self, ancestor, rev):
+        return subprocess.run(
+            ["git", "-C", str(self.repo_root), "merge-base", "--is-ancestor", ancestor, rev],
+            capture_output=True,
+        ).returncode == 0
+
+    def diff_tree(self, old, new, suffix=None):
+        """Return [(path, blob_sha or None)] for files changed between two commits; None means deleted."""
+        tokens = self._git("diff-tree", "-r", "-z", "--no-renames", old, new).split(b"\0")
+        changes = []
+        for meta, path in zip(tokens[0::2], tokens[1::2]):
+            _, new_mode, _, sha, status = meta.decode().lstrip(":").split()
+            path = path.decode("utf-8", errors="surrogateescape")
+            if suffix and not path.endswith(suffix):
+                continue
+            if status == "D" or new_mode in ("120000", "160000"):
+                changes.append((path, None))
+            else:
+                changes.append((path, sha))
+        return changes
+
+    # === Blobs ===
+    def read_blob(self, sha):
+        """Return the raw bytes of a blob via the shared cat-file process."""
+        if self._proc is None:
+            self._proc = subprocess.Popen(
+                ["git", "-C", str(self.repo_root), "cat-file", "--batch"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            )
+        self._proc.stdin.write(f"{sha}\n".encode())
+        self._proc.stdin.flush()
+        header = self._proc.stdout.readline()
+        if not header or header.endswith(b" missing\n"):
+            raise KeyError(sha)
+        size = int(header.split()[2])
+        data = self._proc.stdout.read(size)
+        self._proc.stdout.read(1)  # trailing newline
+        return data
+
+    def map_blobs(self, rev, fn, suffix=None, exclude=()):
+        """
+        Apply fn(text) to every matching file in rev and return [(path, result)].
+        Results are cached per (fn, blob SHA); non UTF-8 blobs are skipped.
+        """
+        results = []
+        for path, sha in self.ls_tree(rev, suffix=suffix, exclude=exclude):
+            key = (fn, sha)
+            if key not in self._results:
+                try:
+                    self._results[key] = fn(self.read_blob(sha).decode("utf-8"))
+                except UnicodeDecodeError:
+                    self._results[key] = None
+            if self._results[key] is not None:
+                results.append((path, self._results[key]))
+        return results
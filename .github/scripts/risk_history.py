@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+CodexDaemon Risk History
+------------------------
+Per-file mutation risk across commits, kept in .codex/risk_history.json.
+
+The store is columnar and sparse:
+  - commits / times      one entry per recorded first-parent commit
+  - blobs.sha/score/hits one entry per distinct .py blob ever scored
+  - files[path].at/blob  change points: from commit index `at` the file is blob
+                         id `blob` (-1 once deleted)
+
+Updates only walk commits newer than the last recorded one and only score
+blobs that were never seen before, so refreshing after a push is cheap and
+"risk over time" / "biggest movers" queries are plain in-memory lookups.
+
+Usage:
+    python3 .github/scripts/risk_history.py update
+    python3 .github/scripts/risk_history.py trend codex_runner.py
+    python3 .github/scripts/risk_history.py movers --since HEAD~10
+"""
+
+import sys
+import json
+import hashlib
+import argparse
+from bisect import bisect_right
+from pathlib import Path
+
+from git_objects import GitObjectStore
+from update_mutation_risk import PATTERNS, SKIP_PARTS, analyze_text
+
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+HISTORY_PATH = REPO_ROOT / ".codex" / "risk_history.json"
+SPARK = "▁▂▃▄▅▆▇█"
+
+
+def patterns_fingerprint():
+    return hashlib.sha1(json.dumps(sorted(PATTERNS.items())).encode()).hexdigest()
+
+
+class RiskHistory:
+    def __init__(self, data=None):
+        data = data or {}
+        self.patterns = data.get("patterns", patterns_fingerprint())
+        self.commits = data.get("commits", [])
+        self.times = data.get("times", [])
+        blobs = data.get("blobs", {})
+        self.blob_sha = blobs.get("sha", [])
+        self.blob_score = blobs.get("score", [])
+        self.blob_hits = blobs.get("hits", [])
+        self.files = data.get("files", {})
+        self._blob_ids = {sha: i for i, sha in enumerate(self.blob_sha)}
+        self._commit_ids = {sha: i for i, sha in enumerate(self.commits)}
+
+    # === Persistence ===
+    @classmethod
+    def load(cls, path=HISTORY_PATH):
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        history = cls(json.loads(path.read_text(encoding="utf-8")))
+        if history.patterns != patterns_fingerprint():
+            print("⚠️ Risk patterns changed — rebuilding history.")
+            return cls()
+        return history
+
+    def save(self, path=HISTORY_PATH):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "patterns": self.patterns,
+            "commits": self.commits,
+            "times": self.times,
+            "blobs": {"sha": self.blob_sha, "score": self.blob_score, "hits": self.blob_hits},
+            "files": self.files,
+        }
+        path.write_text(json.dumps(data, separators=(",", ":")) + "\n", encoding="utf-8")
+
+    # === Incremental Update ===
+    def _blob_id(self, store, sha):
+        if sha not in self._blob_ids:
+            try:
+                score, hits = analyze_text(store.read_blob(sha).decode("utf-8"))
+            except UnicodeDecodeError:
+                score, hits = 0, 0
+            self._blob_ids[sha] = len(self.blob_sha)
+            self.blob_sha.append(sha)
+            self.blob_score.append(score)
+            self.blob_hits.append(hits)
+        return self._blob_ids[sha]
+
+    def _set(self, path, index, blob_id):
+        column = self.files.setdefault(path, {"at": [], "blob": []})
+        if column["blob"] and column["blob"][-1] == blob_id:
+            return
+        column["at"].append(index)
+        column["blob"].append(blob_id)
+
+    def update(self, store, rev="HEAD"):
+        """Record every first-parent commit up to rev that is not stored yet; returns the count."""
+        head = store.resolve(rev)
+        last = self.commits[-1] if self.commits else None
+        if last and not store.is_ancestor(last, head):
+            print("⚠️ Recorded history is not an ancestor of HEAD — rebuilding.")
+            self.__init__()
+            last = None
+
+        new_commits = store.rev_list(head, since=last)
+        for sha, ts in new_commits:
+            index = len(self.commits)
+            if last is None:
+                changes = store.ls_tree(sha, suffix=".py")
+            else:
+                changes = store.diff_tree(last, sha, suffix=".py")
+            for path, blob_sha in changes:
+                if any(p in path for p in SKIP_PARTS):
+                    continue
+                self._set(path, index, self._blob_id(store, blob_sha) if blob_sha else -1)
+            self.commits.append(sha)
+            self.times.append(ts)
+            self._commit_ids[sha] = index
+            last = sha
+        return len(new_commits)
+
+    # === Queries ===
+    def _blob_at(self, path, index):
+        column = self.files.get(path)
+        if not column:
+            return -1
+        pos = bisect_right(column["at"], index) - 1
+        return column["blob"][pos] if pos >= 0 else -1
+
+    def score_at(self, path, index):
+        blob_id = self._blob_at(path, index)
+        return self.blob_score[blob_id] if blob_id >= 0 else 0
+
+    def hits_at(self, path, index):
+        blob_id = self._blob_at(path, index)
+        return self.blob_hits[blob_id] if blob_id >= 0 else 0
+
+    def commit_index(self, store, rev):
+        sha = store.resolve(rev)
+        if sha not in self._commit_ids:
+            raise ValueError(f"{rev} is not in the recorded first-parent history")
+        return self._commit_ids[sha]
+
+    def risk_over_time(self, path, last=None):
+        """Return [(commit_sha, unix_time, score, hits)] for path, optionally only the last N commits."""
+        start = max(0, len(self.commits) - last) if last else 0
+        return [
+            (self.commits[i], self.times[i], self.score_at(path, i), self.hits_at(path, i))
+            for i in range(start, len(self.commits))
+        ]
+
+    def biggest_movers(self, since_index, limit=10):
+        """Return [(path, before, after, delta)] ordered by absolute score change since since_index."""
+        head = len(self.commits) - 1
+        movers = []
+        for path in self.files:
+            before, after = self.score_at(path, since_index), self.score_at(path, head)
+            if before != after:
+                movers.append((path, before, after, after - before))
+        movers.sort(key=lambda m: (-abs(m[3]), m[0]))
+        return movers[:limit]
+
+    def sparkline(self, path, last=20):
+        scores = [score for _, _, score, _ in self.risk_over_time(path, last=last)]
+        top = max(scores, default=0)
+        if not top:
+            return SPARK[0] * len(scores)
+        return "".join(SPARK[round(s / top * (len(SPARK) - 1))] for s in scores)
+
+
+def refresh_history(rev="HEAD"):
+    """Load, incrementally update and save the history."""
+    history = RiskHistory.load()
+    with GitObjectStore(REPO_ROOT) as store:
+        added = history.update(store, rev)
+    history.save()
+    print(f"✅ Risk history: +{added} commits ({len(history.commits)} total, {len(history.blob_sha)} blobs)")
+    return history
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CodexDaemon per-file risk history")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("update", help="Record new commits up to HEAD")
+    trend = sub.add_parser("trend", help="Show risk over time for one file")
+    trend.add_argument("path")
+    trend.add_argument("--last", type=int, default=20)
+    movers = sub.add_parser("movers", help="Show files whose risk changed most since REV")
+    movers.add_argument("--since", required=True, metavar="REV")
+    movers.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.command == "update":
+        refresh_history()
+        return
+
+    # Queries are read-only: never rewrite the tracked store here.
+    history = RiskHistory.load()
+    with GitObjectStore(REPO_ROOT) as store:
+        if not history.commits or history.commits[-1] != store.resolve("HEAD"):
+            print("⚠️ Risk history is behind HEAD — run `risk_history.py update` to refresh.")
+        try:
+            if args.command == "trend":
+                for sha, _, score, hits in history.risk_over_time(args.path, last=args.last):
+                    print(f"{sha[:10]}  {score:>4}  ({hits} hits)")
+            elif args.command == "movers":
+                for path, before, after, delta in history.biggest_movers(
+                    history.commit_index(store, args.since), limit=args.limit
+                ):
+                    print(f"{delta:+5}  {before:>4} → {after:<4} {path}")
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
+import io
 import os
 import re
 import ast
+import sys
+import argparse
 from datetime import datetime
 from pathlib import Path
 
@@ -21,11 +24,14 @@ def scan_files():
                 py_files.append(Path(root) / file)
     return py_files
 
+def strip_trailing_whitespace(lines):
+    return [re.sub(r"[ \t]+$", "", line) for line in lines]
+
 def sanitize_file(path):
     with open(path, "r", encoding="utf-8") as f:
         original = f.readlines()
 
-    cleaned = [re.sub(r"[ \t]+$", "", line) for line in original]
+    cleaned = strip_trailing_whitespace(original)
     modified = original != cleaned
 
     if modified:
@@ -34,6 +40,9 @@ def sanitize_file(path):
 
     return modified
 
+def risk_score(name):
+    return (sum(ord(c) for c in name) % 45) + 5
+
 def generate_risk_scores(py_files):
     scores = []
     syntax_errors = 0
@@ -42,14 +51,28 @@ def generate_risk_scores(py_files):
         try:
             with open(f, "r", encoding="utf-8") as src:
                 ast.parse(src.read())
-            score = (sum(ord(c) for c in f.name) % 45) + 5
-            scores.append((str(f.relative_to(REPO_ROOT)), score))
+            scores.append((str(f.relative_to(REPO_ROOT)), risk_score(f.name)))
         except SyntaxError:
             syntax_errors += 1
 
     scores.sort(key=lambda x: -x[1])
     return scores, syntax_errors
 
+def inspect_source(text):
+    """Return (needs_cleaning, parses) for one blob without touching disk."""
+    # Same newline handling as readlines() on a file opened in text mode.
+    lines = io.StringIO(text, newline=None).readlines()
+    try:
+        ast.parse("".join(lines))
+        parses = True
+    except SyntaxError:
+        parses = False
+    return lines != strip_trailing_whitespace(lines), parses
+
+def scan_files_rev(store, rev):
+    """List .py files of a commit from the git object database with their inspection results."""
+    return store.map_blobs(rev, inspect_source, suffix=PY_EXT, exclude=EXCLUDE_DIRS)
+
 def build_readme_block(total, cleaned, errors, risk_data):
     timestamp = datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
     date_str = timestamp.split("T")[0]
@@ -112,5 +135,34 @@ def main():
     print(f"  Errors  : {syntax_errors}")
     print(f"  Top     : {risk_scores[:3]}")
 
+def report_revisions(revs):
+    from git_objects import GitObjectStore
+
+    with GitObjectStore(REPO_ROOT) as store:
+        for rev in revs:
+            try:
+                inspected = scan_files_rev(store, rev)
+            except ValueError as e:
+                print(f"❌ {e}")
+                sys.exit(1)
+            dirty = sum(needs_cleaning for _, (needs_cleaning, _) in inspected)
+            errors = sum(not parses for _, (_, parses) in inspected)
+            scores = sorted(
+                ((path, risk_score(Path(path).name)) for path, (_, parses) in inspected if parses),
+                key=lambda x: -x[1],
+            )
+            print(f"[SUMMARY @ {rev}]")
+            print(f"  Total   : {len(inspected)}")
+            print(f"  Dirty   : {dirty}")
+            print(f"  Errors  : {errors}")
+            print(f"  Top     : {scores[:3]}")
+
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="CodexDaemon repo sanitizer")
+    parser.add_argument("--rev", action="append", metavar="REV",
+                        help="Inspect a commit from the git object database (read-only, repeatable)")
+    args = parser.parse_args()
+    if args.rev:
+        report_revisions(args.rev)
+    else:
+        main()
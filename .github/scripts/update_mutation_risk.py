@@ -1,11 +1,15 @@
 #!/usr/bin/env python3
+import io
 import os
 import re
+import sys
+import argparse
 from pathlib import Path
 from datetime import datetime
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 README_PATH = REPO_ROOT / "README.md"
+SKIP_PARTS = [".venv", "__pycache__", "site-packages"]
 
 # Risky code patterns and weights
 PATTERNS = {
@@ -20,22 +24,30 @@ PATTERNS = {
     r"openai\.api_key": 5,
 }
 
+def analyze_text(text):
+    """Return (score, hits) where hits counts matched pattern occurrences by line."""
+    score = hits = 0
+    for line in io.StringIO(text, newline=None):
+        for pattern, weight in PATTERNS.items():
+            if re.search(pattern, line):
+                score += weight
+                hits += 1
+    return score, hits
+
+def score_text(text):
+    return analyze_text(text)[0]
+
 def score_file(filepath):
     try:
-        score = 0
         with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                for pattern, weight in PATTERNS.items():
-                    if re.search(pattern, line):
-                        score += weight
-        return score
+            return score_text(f.read())
     except Exception:
         return 0
 
 def collect_scores():
     scores = []
     for path in REPO_ROOT.rglob("*.py"):
-        if any(p in str(path) for p in [".venv", "__pycache__", "site-packages"]):
+        if any(p in str(path) for p in SKIP_PARTS):
             continue
         score = score_file(path)
         if score > 0:
@@ -43,7 +55,41 @@ def collect_scores():
             scores.append((rel_path, score))
     return sorted(scores, key=lambda x: x[1], reverse=True)
 
-def inject_into_readme(scores):
+def collect_scores_rev(store, rev):
+    """Score .py files of a commit straight from the git object database."""
+    scores = [
+        (path, score)
+        for path, score in store.map_blobs(rev, score_text, suffix=".py")
+        if score > 0 and not any(p in path for p in SKIP_PARTS)
+    ]
+    return sorted(scores, key=lambda x: x[1], reverse=True)
+
+def build_history_sections(history, since_index, since_label):
+    """Return (trend_by_path, movers_html) rendered from a RiskHistory."""
+    trends = {path: history.sparkline(path) for path in history.files}
+    movers = history.biggest_movers(since_index, limit=10)
+    if not movers:
+        rows = "<tr><td colspan='3' align='center'>No risk changes</td></tr>"
+    else:
+        rows = "\n".join(
+            f"<tr><td>{path}</td><td align='right'>{before} → {after}</td><td align='right'>{delta:+}</td></tr>"
+            for path, before, after, delta in movers
+        )
+    movers_html = f"""
+<h4 style="color:#f97316;">📈 Biggest Movers since {since_label}</h4>
+
+<table style="width:70%; border-collapse:collapse; color:#f8f8f8; font-family:monospace;">
+<tr style="color:#f97316;">
+<th align="left">File</th>
+<th align="right">Score</th>
+<th align="right">Δ</th>
+</tr>
+{rows}
+</table>
+"""
+    return trends, movers_html
+
+def inject_into_readme(scores, history=None, since_index=0, since_label=None):
     with open(README_PATH, "r", encoding="utf-8") as f:
         content = f.read()
 
@@ -56,8 +102,15 @@ def inject_into_readme(scores):
 
     timestamp = datetime.utcnow().isoformat() + "Z"
 
+    trends, movers_html = {}, ""
+    if history is not None:
+        trends, movers_html = build_history_sections(history, since_index, since_label)
+    trend_header = "\n<th align=\"left\">Trend</th>" if trends else ""
+
     rows = "\n".join(
-        f"<tr><td>{path}</td><td align='right'>{score}</td></tr>"
+        f"<tr><td>{path}</td><td align='right'>{score}</td>"
+        + (f"<td>{trends.get(path, '')}</td>" if trends else "")
+        + "</tr>"
         for path, score in scores[:10]
     )
 
@@ -71,11 +124,11 @@ def inject_into_readme(scores):
 <table style="width:70%; border-collapse:collapse; color:#f8f8f8; font-family:monospace;">
 <tr style="color:#f97316;">
 <th align="left">File</th>
-<th align="right">Risk Score</th>
+<th align="right">Risk Score</th>{trend_header}
 </tr>
 {rows}
 </table>
-
+{movers_html}
 <pre style="text-align:left; color:#f0cfcf; background:#111; padding:15px;
     border-radius:10px; border:1px solid #f97316; box-shadow:inset 0 0 6px #f97316;">
 CodexDaemon performed a self-inspection on potential mutation vectors.
@@ -94,5 +147,49 @@ Scan timestamp: {timestamp}
 
     print("✅ Mutation Risk Score updated in README.md")
 
+def inject_with_history(since):
+    from git_objects import GitObjectStore
+    from risk_history import refresh_history
+
+    history = refresh_history()
+    with GitObjectStore(REPO_ROOT) as store:
+        try:
+            if since:
+                since_index = history.commit_index(store, since)
+            else:
+                since_index = max(0, len(history.commits) - 11)
+                since = history.commits[since_index][:7] if history.commits else "start"
+        except ValueError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+    inject_into_readme(collect_scores(), history=history, since_index=since_index, since_label=since)
+
+def print_rev_scores(revs):
+    from git_objects import GitObjectStore
+
+    with GitObjectStore(REPO_ROOT) as store:
+        for rev in revs:
+            try:
+                scores = collect_scores_rev(store, rev)
+            except ValueError as e:
+                print(f"❌ {e}")
+                sys.exit(1)
+            print(f"🧬 Mutation Risk @ {rev}")
+            for path, score in scores[:10]:
+                print(f"  {score:>4}  {path}")
+
 if __name__ == "__main__":
-    inject_into_readme(collect_scores())
+    parser = argparse.ArgumentParser(description="CodexDaemon mutation risk score")
+    parser.add_argument("--rev", action="append", metavar="REV",
+                        help="Score a commit from the git object database instead of the working tree (repeatable)")
+    parser.add_argument("--history", action="store_true",
+                        help="Update .codex/risk_history.json and render trends + biggest movers")
+    parser.add_argument("--since", metavar="REV",
+                        help="Baseline for biggest movers (default: 10 commits back)")
+    args = parser.parse_args()
+    if args.rev:
+        print_rev_scores(args.rev)
+    elif args.history:
+        inject_with_history(args.since)
+    else:
+        inject_into_readme(collect_scores())
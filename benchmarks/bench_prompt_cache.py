@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+CodexDaemon Prompt Cache Benchmark
+----------------------------------
+Sends a batch of different instructions against the same file through
+codex_runner.request_completion, backed by a local stub that mimics
+provider-side prompt caching (prefix match in 128-token steps once the
+prompt is at least 1024 tokens). Compares the legacy layout (instruction
+before file content) with the current build_messages layout.
+
+No network calls are made; a dummy OPENAI_API_KEY is used if none is set.
+
+Usage:
+    python3 benchmarks/bench_prompt_cache.py
+    python3 benchmarks/bench_prompt_cache.py --file README.md
+"""
+
+import os
+import sys
+import asyncio
+import hashlib
+import argparse
+from pathlib import Path
+from types import SimpleNamespace
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark-stub")
+os.environ.setdefault("CODEX_HEDGE_PERCENTILE", "0")
+
+import codex_runner  # noqa: E402
+
+CHARS_PER_TOKEN = 4
+MIN_CACHED_TOKENS = 1024
+CACHE_STEP = 128
+
+INSTRUCTIONS = [
+    "add type hints to every function",
+    "improve logging around git operations",
+    "add a --dry-run flag that prints the new content instead of writing it",
+    "document the environment variables in the module docstring",
+    "rename get_repo to open_repo",
+    "add retries with backoff around the OpenAI call",
+    "make the health check report the Python version",
+    "split main() into smaller helpers",
+    "validate that the target file stays inside PROJECT_DIR",
+    "add a --model flag overriding CODEX_MODEL",
+]
+
+
+# === Stub Provider ===
+class PrefixCacheStub:
+    """Stand-in for client.chat.completions that reports cached prompt tokens."""
+
+    def __init__(self):
+        self.prefixes = set()
+        self.chat = SimpleNamespace(completions=self)
+
+    @staticmethod
+    def _tokens(messages):
+        text = "".join(f"<|{m['role']}|>{m['content']}<|end|>" for m in messages)
+        return [text[i:i + CHARS_PER_TOKEN] for i in range(0, len(text), CHARS_PER_TOKEN)]
+
+    @staticmethod
+    def _key(tokens):
+        return hashlib.sha1("".join(tokens).encode()).hexdigest()
+
+    async def create(self, model, messages, **kwargs):
+        tokens = self._tokens(messages)
+        steps = range(MIN_CACHED_TOKENS, len(tokens) + 1, CACHE_STEP)
+        cached = max((n for n in steps if self._key(tokens[:n]) in self.prefixes), default=0)
+        self.prefixes.update(self._key(tokens[:n]) for n in steps)
+        usage = SimpleNamespace(
+            prompt_tokens=len(tokens),
+            completion_tokens=1,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=cached),
+        )
+        message = SimpleNamespace(content="ok")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+def legacy_messages(prompt, context):
+    return [
+        {"role": "system", "content": codex_runner.SYSTEM_PROMPT},
+        {"role": "user", "content": f"Task: {prompt}\n\n---- FILE CONTENT ----\n{context}\n---- END ----"},
+    ]
+
+
+# === Benchmark ===
+async def run_layout(build, context):
+    codex_runner.client = PrefixCacheStub()
+    for key in ("calls", "prompt_tokens", "cached_tokens"):
+        codex_runner.RUN_METRICS[key] = 0
+    hits = 0
+    for instruction in INSTRUCTIONS:
+        before = codex_runner.RUN_METRICS["cached_tokens"]
+        await codex_runner.request_completion(build(instruction, context))
+        hits += codex_runner.RUN_METRICS["cached_tokens"] > before
+    return hits, codex_runner.RUN_METRICS["prompt_tokens"], codex_runner.RUN_METRICS["cached_tokens"]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Prompt cache prefix-hit benchmark")
+    ap.add_argument("--file", default="codex_runner.py", help="File used as edit context")
+    args = ap.parse_args()
+
+    context = (REPO_ROOT / args.file).read_text(encoding="utf-8", errors="ignore")
+    print(f"File: {args.file} (~{len(context) // CHARS_PER_TOKEN} tokens), {len(INSTRUCTIONS)} instructions")
+    print(f"{'layout':<10} {'prefix hits':>12} {'cached tokens':>22}")
+    for name, build in (("legacy", legacy_messages), ("current", codex_runner.build_messages)):
+        hits, prompt_tokens, cached_tokens = asyncio.run(run_layout(build, context))
+        ratio = cached_tokens / prompt_tokens if prompt_tokens else 0.0
+        print(f"{name:<10} {hits:>5}/{len(INSTRUCTIONS):<6} {cached_tokens:>9}/{prompt_tokens:<7} {ratio:>5.0%}")
+
+
+if __name__ == "__main__":
+    main()
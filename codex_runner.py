@@ -11,6 +11,7 @@ to your CodexDaemon repository.
 Usage Examples:
     python3 codex_runner.py "add a function to fetch weather data"
     python3 codex_runner.py "improve logging in codex_runner.py" --commit
+    python3 codex_runner.py "refactor codex_runner.py" --candidates 3
     python3 codex_runner.py --health
     python3 codex_runner.py --time
 """
@@ -18,13 +19,19 @@ Usage Examples:
 import os
 import sys
 import re
+import ast
+import asyncio
+import json
+import time
 import argparse
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from rich.console import Console
 from git import Repo, Actor
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 console = Console()
 
@@ -38,12 +45,102 @@ else:
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 PROJECT_DIR = Path(os.getenv("PROJECT_DIR", Path(__file__).resolve().parent)).resolve()
 MODEL = os.getenv("CODEX_MODEL", "gpt-4o")
+CODEX_DIR = PROJECT_DIR / ".codex"
+LATENCY_PATH = CODEX_DIR / "latency.json"
+METRICS_PATH = CODEX_DIR / "metrics.jsonl"
+HEDGE_PERCENTILE = float(os.getenv("CODEX_HEDGE_PERCENTILE", "95"))
+HEDGE_MIN_SAMPLES = int(os.getenv("CODEX_HEDGE_MIN_SAMPLES", "20"))
+LATENCY_WINDOW = 200
 
 if not OPENAI_API_KEY:
     console.print("[red]ERROR: OPENAI_API_KEY not set.[/red]")
     sys.exit(1)
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+client = AsyncOpenAI(api_key=OPENAI_API_KEY)
+
+
+# === Run Metrics ===
+class LatencyHistogram:
+    """Rolling window of model call latencies, persisted per model in .codex/."""
+
+    def __init__(self, path, model, window=LATENCY_WINDOW):
+        self.path = Path(path)
+        self.model = model
+        self.window = window
+        self.data = {}
+        if self.path.exists():
+            try:
+                self.data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (ValueError, OSError):
+                self.data = {}
+        self.samples = list(self.data.get(model, []))[-window:]
+
+    def record(self, seconds):
+        self.samples = (self.samples + [round(seconds, 3)])[-self.window:]
+
+    def percentile(self, p):
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, int(round(p / 100 * (len(ordered) - 1)))))
+        return ordered[index]
+
+    def expected_above(self, seconds):
+        """Mean historical latency among calls slower than `seconds`, or None."""
+        slower = [s for s in self.samples if s > seconds]
+        return sum(slower) / len(slower) if slower else None
+
+    def save(self):
+        self.data[self.model] = self.samples
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.data, indent=2) + "\n", encoding="utf-8")
+
+
+LATENCY = LatencyHistogram(LATENCY_PATH, MODEL)
+RUN_METRICS = {"calls": 0, "requests": 0, "responses": 0, "hedged": 0, "hedge_wins": 0,
+               "saved_s": 0.0, "prompt_tokens": 0, "cached_tokens": 0}
+
+
+def hedge_threshold():
+    if HEDGE_PERCENTILE <= 0 or len(LATENCY.samples) < HEDGE_MIN_SAMPLES:
+        return None
+    return LATENCY.percentile(HEDGE_PERCENTILE)
+
+
+def write_run_metrics():
+    calls = RUN_METRICS["calls"]
+    entry = {
+        "timestamp": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
+        "model": MODEL,
+        **RUN_METRICS,
+        "saved_s": round(RUN_METRICS["saved_s"], 3),
+        "hedge_rate": round(RUN_METRICS["hedged"] / calls, 3) if calls else 0.0,
+        # Token counts cover completed responses only; cancelled requests
+        # (hedge losers, superseded candidates) and failed ones report no usage.
+        "unaccounted_requests": RUN_METRICS["requests"] - RUN_METRICS["responses"],
+        "cache_ratio": round(RUN_METRICS["cached_tokens"] / RUN_METRICS["prompt_tokens"], 3)
+        if RUN_METRICS["prompt_tokens"] else 0.0,
+    }
+    LATENCY.save()
+    with open(METRICS_PATH, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+    console.print(
+        f"[blue]Model calls:[/blue] {calls}  "
+        f"[blue]Hedge rate:[/blue] {entry['hedge_rate']:.0%}  "
+        f"[blue]Hedge wins:[/blue] {entry['hedge_wins']}  "
+        f"[blue]Est. saved:[/blue] {entry['saved_s']:.1f}s  "
+        f"[blue]Cached tokens:[/blue] {entry['cached_tokens']}/{entry['prompt_tokens']} "
+        f"({entry['unaccounted_requests']} cancelled or failed requests unaccounted)"
+    )
+
+
+def record_usage(usage):
+    RUN_METRICS["responses"] += 1
+    if usage is None:
+        return
+    details = getattr(usage, "prompt_tokens_details", None)
+    RUN_METRICS["prompt_tokens"] += getattr(usage, "prompt_tokens", 0) or 0
+    RUN_METRICS["cached_tokens"] += getattr(details, "cached_tokens", 0) or 0
 
 
 # === Repository Helper ===
@@ -60,6 +157,8 @@ def health_check():
     console.rule("[green]🧠 CodexDaemon Health Check")
     console.print(f"[bold]Project Dir:[/bold] {PROJECT_DIR}")
     console.print(f"[bold]Model:[/bold] {MODEL}")
+    console.print(f"[bold]Hedging:[/bold] p{HEDGE_PERCENTILE:g} after {HEDGE_MIN_SAMPLES} samples "
+                  f"({len(LATENCY.samples)} recorded)")
     console.print(f"[bold]OpenAI Key Loaded:[/bold] {'✅' if OPENAI_API_KEY else '❌'}")
     try:
         repo = get_repo()
@@ -81,28 +180,181 @@ def say_hello():
 
 
 # === AI Engine ===
-def ask_model(prompt, context):
-    system = (
-        "You are a senior Python engineer. "
-        "Implement the requested change directly and return the full updated file content. "
-        "Do not return a diff or patch."
+SYSTEM_PROMPT = (
+    "You are a senior Python engineer. "
+    "Implement the requested change directly and return the full updated file content. "
+    "Do not return a diff or patch."
+)
+
+
+def build_messages(prompt, context):
+    """
+    Static parts first, instruction last: the system prompt and file content form
+    a byte-identical prefix across instructions so provider prompt caching can hit.
+    """
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": f"---- FILE CONTENT ----\n{context}\n---- END ----"},
+        {"role": "user", "content": f"Task: {prompt}"},
+    ]
+
+
+async def _timed_completion(messages):
+    RUN_METRICS["requests"] += 1
+    start = time.monotonic()
+    r = await client.chat.completions.create(
+        model=MODEL,
+        messages=messages,
+        temperature=0.2,
+        max_tokens=4000,
     )
+    return r, time.monotonic() - start
+
+
+async def request_completion(messages):
+    """Run one completion, hedging with a duplicate once it exceeds the latency percentile."""
+    RUN_METRICS["calls"] += 1
+    started = time.monotonic()
+    primary = asyncio.create_task(_timed_completion(messages))
+    pending = {primary}
+    issued = [primary]
+    winner, error = None, None
     try:
-        r = client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {"role": "system", "content": system},
-                {"role": "user", "content": f"Task: {prompt}\n\n---- FILE CONTENT ----\n{context}\n---- END ----"},
-            ],
-            temperature=0.2,
-            max_tokens=4000,
-        )
-        return r.choices[0].message.content.strip()
+        threshold = hedge_threshold()
+        if threshold is not None:
+            done, _ = await asyncio.wait(pending, timeout=threshold)
+            if not done:
+                hedge = asyncio.create_task(_timed_completion(messages))
+                pending.add(hedge)
+                issued.append(hedge)
+                RUN_METRICS["hedged"] += 1
+
+        while pending and winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    winner = task
+                    break
+                error = task.exception()
+    finally:
+        # Also reached when the caller cancels us (e.g. a superseded --candidates request).
+        for task in issued:
+            task.cancel()
+        await asyncio.gather(*issued, return_exceptions=True)
+        for task in issued:
+            if task.done() and not task.cancelled() and task.exception() is None:
+                record_usage(getattr(task.result()[0], "usage", None))
+        # The primary was still running at `elapsed` if cancelled; estimate its finish
+        # from slower samples before this run's own sample joins the window.
+        elapsed = time.monotonic() - started
+        expected = LATENCY.expected_above(elapsed)
+        # The window tracks the primary only; a cancelled primary (hedged away or
+        # superseded candidate) contributes its elapsed time as a lower bound so
+        # the slow tail is not lost.
+        if primary.cancelled():
+            LATENCY.record(elapsed)
+        elif primary.exception() is None:
+            LATENCY.record(primary.result()[1])
+    if winner is None:
+        raise error
+
+    r, _ = winner.result()
+    if winner is not primary:
+        RUN_METRICS["hedge_wins"] += 1
+        RUN_METRICS["saved_s"] += max(0.0, expected - elapsed) if expected else 0.0
+    return r.choices[0].message.content.strip()
+
+
+def ask_model(prompt, context):
+    try:
+        return asyncio.run(request_completion(build_messages(prompt, context)))
     except Exception as e:
         console.print(f"[red]OpenAI error:[/red] {e}")
         sys.exit(1)
 
 
+# === Candidate Validation ===
+README_MARKER = re.compile(r"<!--[^>]*?(?:START|END)[^>]*?-->")
+
+
+def validate_content(target_file, new_content, original):
+    """Return (ok, reason) for a candidate replacement of target_file."""
+    target_file = Path(target_file)
+    suffix = target_file.suffix.lower()
+    if not new_content.strip():
+        return False, "empty response"
+    if suffix == ".py":
+        try:
+            compile(ast.parse(new_content, filename=str(target_file)), str(target_file), "exec")
+        except (SyntaxError, ValueError) as e:
+            return False, f"python: {e}"
+    elif suffix in (".yml", ".yaml"):
+        try:
+            import yaml
+        except ImportError:
+            return True, "yaml not installed — skipped"
+        try:
+            yaml.safe_load(new_content)
+        except yaml.YAMLError as e:
+            return False, f"yaml: {e}"
+    elif target_file.name.lower() == "readme.md":
+        expected, found = README_MARKER.findall(original), README_MARKER.findall(new_content)
+        if found != expected:
+            missing = Counter(expected) - Counter(found)
+            extra = Counter(found) - Counter(expected)
+            if missing:
+                return False, f"readme markers lost: {', '.join(sorted(missing))}"
+            if extra:
+                return False, f"readme markers duplicated: {', '.join(sorted(extra))}"
+            return False, "readme markers reordered"
+    return True, "ok"
+
+
+async def _generate_candidate(index, messages, target_file, original, pool):
+    content = await request_completion(messages)
+    loop = asyncio.get_running_loop()
+    ok, reason = await loop.run_in_executor(pool, validate_content, target_file, content, original)
+    return index, content, ok, reason
+
+
+async def _first_valid_candidate(prompt, context, target_file, n):
+    messages = build_messages(prompt, context)
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        tasks = [
+            asyncio.create_task(_generate_candidate(i, messages, target_file, context, pool))
+            for i in range(n)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    index, content, ok, reason = await next_done
+                except Exception as e:
+                    console.print(f"[yellow]Candidate failed:[/yellow] {e}")
+                    continue
+                if ok:
+                    console.print(f"[green]Accepted candidate {index + 1}/{n}[/green]")
+                    return content
+                console.print(f"[yellow]Rejected candidate {index + 1}/{n}:[/yellow] {reason}")
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def ask_model_candidates(prompt, context, target_file, n):
+    """Request n completions concurrently and return the first that validates."""
+    try:
+        content = asyncio.run(_first_valid_candidate(prompt, context, target_file, n))
+    except Exception as e:
+        console.print(f"[red]OpenAI error:[/red] {e}")
+        sys.exit(1)
+    if content is None:
+        console.print(f"[red]❌ No valid candidate out of {n} — file left unchanged[/red]")
+        sys.exit(1)
+    return content
+
+
 # === File Editing ===
 def update_file(target_file, new_content):
     Path(target_file).write_text(new_content, encoding="utf-8")
@@ -134,6 +386,8 @@ def main():
     ap.add_argument("--commit", action="store_true", help="Commit and push changes")
     ap.add_argument("--health", action="store_true", help="Run environment health check")
     ap.add_argument("--time", action="store_true", help="Print current UTC time")
+    ap.add_argument("--candidates", type=int, default=1,
+                    help="Request N candidates in parallel and keep the first valid one")
     args = ap.parse_args()
 
     if args.health:
@@ -165,7 +419,14 @@ def main():
     context = target_path.read_text(encoding="utf-8", errors="ignore")
     console.print(f"[cyan]Editing:[/cyan] {target_path.relative_to(PROJECT_DIR)}")
 
-    new_content = ask_model(args.instruction, context)
+    try:
+        if args.candidates > 1:
+            new_content = ask_model_candidates(args.instruction, context, target_path, args.candidates)
+        else:
+            new_content = ask_model(args.instruction, context)
+    finally:
+        # Also on sys.exit() from the model helpers: failed runs spend the most calls.
+        write_run_metrics()
     update_file(target_path, new_content)
 
     if args.commit: